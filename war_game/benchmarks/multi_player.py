@@ -0,0 +1,64 @@
+"""Per-round cost of MultiGameEngine at 2, 4 and 8 players.
+
+Players drop out as a game goes on, so cost is also reported per
+player-round: the players still active when each round started.
+Only the next_step loop is timed; reset_game is left out.
+
+Run from the war_game directory:
+    python -m benchmarks.multi_player --games 200
+"""
+import argparse
+import random
+import time
+
+from model.multi_engine import MultiGameEngine
+
+
+def bench_players(num_players: int, games: int, max_rounds: int, pot_order: str) -> None:
+    engine = MultiGameEngine(num_players=num_players, pot_order=pot_order)
+
+    total_rounds = 0
+    player_rounds = 0
+    wars = 0
+    elapsed = 0.0
+    for _ in range(games):
+        # Dealing a fresh deck is a fixed per-game cost, keep it out of the timing
+        engine.reset_game()
+        rounds = 0
+        start = time.perf_counter()
+        while rounds < max_rounds:
+            result = engine.next_step()
+            if result.action == "draw":
+                # Every contender of a new round is still active
+                rounds += 1
+                player_rounds += len(result.faces)
+            elif result.action == "war_start":
+                wars += 1
+            if result.game_over:
+                break
+        elapsed += time.perf_counter() - start
+        total_rounds += rounds
+
+    print(
+        f"{num_players} players  avg rounds: {total_rounds / games:8.1f}   "
+        f"avg active: {player_rounds / total_rounds:4.2f}   "
+        f"wars/game: {wars / games:6.1f}   us/round: {elapsed / total_rounds * 1e6:6.2f}   "
+        f"us/player-round: {elapsed / player_rounds * 1e6:5.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--max-rounds", type=int, default=5000)
+    parser.add_argument("--pot-order", default="by_rank")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for num_players in (2, 4, 8):
+        random.seed(args.seed)
+        bench_players(num_players, args.games, args.max_rounds, args.pot_order)
+
+
+if __name__ == "__main__":
+    main()
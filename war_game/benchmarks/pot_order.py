@@ -0,0 +1,48 @@
+"""Compare pot orders by average game length and games/sec.
+
+Run from the war_game directory:
+    python -m benchmarks.pot_order --games 500
+"""
+import argparse
+import random
+import time
+
+from model.engine import GameEngine, POT_ORDERS
+from model.simulation import play_game
+
+
+def bench_order(pot_order: str, games: int, max_rounds: int, seed: int) -> None:
+    random.seed(seed)
+    engine = GameEngine(war_face_down_count=3, pot_order=pot_order)
+
+    total_rounds = 0
+    capped = 0
+    start = time.perf_counter()
+    for _ in range(games):
+        _, rounds, _ = play_game(engine, max_rounds)
+        total_rounds += rounds
+        # A drawn game (both out of cards) also has no winner, so go by rounds
+        if rounds >= max_rounds:
+            capped += 1
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{pot_order:<13} avg rounds: {total_rounds / games:8.1f}   "
+        f"capped: {capped:4d}   games/sec: {games / elapsed:8.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--max-rounds", type=int, default=5000,
+                        help="rounds after which a looping game is cut off")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for pot_order in POT_ORDERS:
+        bench_order(pot_order, args.games, args.max_rounds, args.seed)
+
+
+if __name__ == "__main__":
+    main()
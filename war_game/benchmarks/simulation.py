@@ -0,0 +1,66 @@
+"""Compare shared-memory result aggregation with returning results through a Pool.
+
+Both paths reuse one GameEngine per worker process, so the difference is how
+results get back to the parent. Process start-up is timed in both paths.
+
+Run from the war_game directory:
+    python -m benchmarks.simulation --games 2000 --workers 4
+"""
+import argparse
+import multiprocessing as mp
+import random
+import time
+
+from model.engine import GameEngine
+from model.simulation import run_simulation, play_game
+
+
+# One engine per pool worker, like the shared-memory workers use
+_pool_engine: GameEngine | None = None
+
+
+def _pool_game(max_rounds: int) -> tuple[int, int, int]:
+    return play_game(_pool_engine, max_rounds)
+
+
+def _pool_init(pot_order: str) -> None:
+    global _pool_engine
+    random.seed()
+    _pool_engine = GameEngine(war_face_down_count=3, pot_order=pot_order)
+
+
+def run_pool(games: int, workers: int, pot_order: str, max_rounds: int) -> int:
+    """baseline: every outcome is pickled back through the pool's result queue"""
+    with mp.Pool(workers, initializer=_pool_init, initargs=(pot_order,)) as pool:
+        results = pool.map(_pool_game, [max_rounds] * games, chunksize=16)
+    return sum(rounds for _, rounds, _ in results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=0, help="0 = one per CPU")
+    parser.add_argument("--pot-order", default="by_rank")
+    parser.add_argument("--max-rounds", type=int, default=5000)
+    args = parser.parse_args()
+    workers = args.workers or mp.cpu_count()
+
+    start = time.perf_counter()
+    summary = run_simulation(args.games, workers, args.pot_order, args.max_rounds)
+    shm_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    run_pool(args.games, workers, args.pot_order, args.max_rounds)
+    pool_elapsed = time.perf_counter() - start
+
+    print(
+        f"{summary.games} games, {workers} workers: player {summary.player_wins} / "
+        f"cpu {summary.cpu_wins} / unfinished {summary.unfinished}, "
+        f"avg rounds {summary.avg_rounds:.1f}, wars {summary.total_wars}"
+    )
+    print(f"shared memory  games/sec: {args.games / shm_elapsed:8.1f}")
+    print(f"pool pickling  games/sec: {args.games / pool_elapsed:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
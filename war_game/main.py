@@ -1,5 +1,11 @@
+import argparse
+
 from ui.gui import run_app
 
 
 if __name__ == "__main__":
-    run_app()
+    parser = argparse.ArgumentParser(description="War card game")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="write a Chrome trace of engine and UI steps to PATH")
+    args = parser.parse_args()
+    run_app(trace_path=args.trace)
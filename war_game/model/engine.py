@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import random
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Generic, Optional, TypeVar
 
 from .card import Card
 from .deck import Deck
 from .player import Player
+from .tracing import ChromeTracer
 
 
 @dataclass
@@ -22,25 +25,129 @@ class StepResult:
     message: str
 
 
-class GameEngine:
-def __init__(self, war_face_down_count: int = 3) -> None:
+# How a won pot is ordered before it goes to the bottom of the winner's pile
+POT_ORDERS = ("fixed", "winner_first", "shuffled", "by_rank")
+
+
+def validate_pot_order(pot_order: str) -> None:
+    if pot_order not in POT_ORDERS:
+        raise ValueError(f"Unknown pot order: {pot_order!r} (expected one of {POT_ORDERS})")
+
+
+def order_pot(pot: list[Card], pot_order: str, winner_cards: set[Card]) -> list[Card]:
+    """returns the pot in the order it goes under the winner's pile
+
+    `winner_cards` (the cards the winner put in) is only used by "winner_first".
+    """
+    if pot_order == "winner_first":
+        # Winner's own cards first, then everyone else's, each in play order
+        return (
+            [card for card in pot if card in winner_cards]
+            + [card for card in pot if card not in winner_cards]
+        )
+
+    if pot_order == "shuffled":
+        cards = list(pot)
+        random.shuffle(cards)
+        return cards
+
+    if pot_order == "by_rank":
+        # Highest first, so the winner plays them back soonest
+        return sorted(pot, key=lambda card: card.value, reverse=True)
+
+    return list(pot)
+
+
+ResultT = TypeVar("ResultT")
+
+
+class BaseEngine(ABC, Generic[ResultT]):
+    """Pot order, tracing and game/round bookkeeping shared by the engines.
+
+    Subclasses implement _reset_game and _next_step, and call _begin_round
+    when a step deals the first cards of a round.
+    """
+
+    def __init__(
+        self,
+        war_face_down_count: int,
+        pot_order: str,
+        tracer: Optional[ChromeTracer],
+    ) -> None:
+        validate_pot_order(pot_order)
+
         self.war_face_down_count = war_face_down_count
+        self.pot_order = pot_order
+        self.pot: list[Card] = []
+        self.state: str = "idle"  # "idle", "compare", "war_down", "war_up", "game_over"
+
+        # Identify spans in a trace; bumped by reset_game / each new round
+        self.tracer = tracer
+        self.game_id = 0
+        self.round_number = 0
+
+    def reset_game(self) -> None:
+        self.game_id += 1
+        self.round_number = 0
+        if self.tracer is None:
+            self._reset_game()
+            return
+        with self.tracer.span("reset_game", "engine", game_id=self.game_id):
+            self._reset_game()
+
+    def next_step(self) -> ResultT:
+        if self.tracer is None:
+            return self._next_step()
+        state = self.state
+        # A step from "idle" deals the first cards of the next round
+        round_number = self.round_number + 1 if state == "idle" else self.round_number
+        with self.tracer.span(
+            f"next_step:{state}", "engine", game_id=self.game_id, round=round_number
+        ):
+            return self._next_step()
+
+    def in_round(self) -> bool:
+        return self.state != "idle" and self.state != "game_over"
+
+    def _begin_round(self) -> None:
+        self.round_number += 1
+
+    @abstractmethod
+    def _reset_game(self) -> None:
+        """deals a fresh game"""
+
+    @abstractmethod
+    def _next_step(self) -> ResultT:
+        """advances the game by one step"""
+
+
+class GameEngine(BaseEngine[StepResult]):
+    def __init__(
+        self,
+        war_face_down_count: int = 3,
+        pot_order: str = "fixed",
+        tracer: Optional[ChromeTracer] = None,
+    ) -> None:
+        super().__init__(war_face_down_count, pot_order, tracer)
+
         self.player = Player("You")
         self.cpu = Player("CPU")
 
-        self.pot: list[Card] = []
-        self.state: str = "idle"  # "idle", "compare", "war_down", "war_up", "game_over"
+        # Player's share of the pot, only tracked when the pot order needs it
+        self._track_player_pot = pot_order == "winner_first"
+        self.player_pot: list[Card] = []
 
         self.last_player_face: Optional[Card] = None
         self.last_cpu_face: Optional[Card] = None
 
-    def reset_game(self) -> None:
+    def _reset_game(self) -> None:
         deck = Deck()
         deck.shuffle()
 
         self.player.clear()
         self.cpu.clear()
         self.pot.clear()
+        self.player_pot.clear()
         self.state = "idle"
         self.last_player_face = None
         self.last_cpu_face = None
@@ -62,10 +169,7 @@ def __init__(self, war_face_down_count: int = 3) -> None:
     def get_scores(self) -> tuple[int, int]:
         return self.player.card_count(), self.cpu.card_count()
 
-    def in_round(self) -> bool:
-        return self.state != "idle" and self.state != "game_over"
-
-    def next_step(self) -> StepResult:
+    def _next_step(self) -> StepResult:
         if self.state == "game_over" or self.is_game_over():
             self.state = "game_over"
             return StepResult(
@@ -109,7 +213,10 @@ def __init__(self, war_face_down_count: int = 3) -> None:
         )
 
     def _start_round_draw(self) -> StepResult:
+        self._begin_round()
         self.pot.clear()
+        if self._track_player_pot:
+            self.player_pot.clear()
 
         p = self.player.draw_card()
         c = self.cpu.draw_card()
@@ -135,6 +242,8 @@ def __init__(self, war_face_down_count: int = 3) -> None:
         self.last_player_face = p
         self.last_cpu_face = c
         self.pot.extend([p, c])
+        if self._track_player_pot:
+            self.player_pot.append(p)
         self.state = "compare"
 
         return StepResult(
@@ -170,7 +279,7 @@ def __init__(self, war_face_down_count: int = 3) -> None:
             )
 
         if p.value > c.value:
-            self.player.add_cards_to_bottom(self.pot)
+            self._award_pot(self.player)
             msg = "Player wins the pot."
             winner = "player"
             self.state = "idle"
@@ -188,7 +297,7 @@ def __init__(self, war_face_down_count: int = 3) -> None:
             )
 
         if p.value < c.value:
-            self.cpu.add_cards_to_bottom(self.pot)
+            self._award_pot(self.cpu)
             msg = "CPU wins the pot."
             winner = "cpu"
             self.state = "idle"
@@ -227,6 +336,8 @@ def __init__(self, war_face_down_count: int = 3) -> None:
 
         self.pot.extend(p_down)
         self.pot.extend(c_down)
+        if self._track_player_pot:
+            self.player_pot.extend(p_down)
 
         self.state = "war_up"
         return StepResult(
@@ -249,6 +360,8 @@ def __init__(self, war_face_down_count: int = 3) -> None:
 
         if p_face is not None:
             self.pot.append(p_face)
+            if self._track_player_pot:
+                self.player_pot.append(p_face)
         if c_face is not None:
             self.pot.append(c_face)
 
@@ -272,7 +385,7 @@ def __init__(self, war_face_down_count: int = 3) -> None:
             )
 
         if p_face is None:
-            self.cpu.add_cards_to_bottom(self.pot)
+            self._award_pot(self.cpu)
             self.state = "idle"
             return StepResult(
                 action="award",
@@ -288,7 +401,7 @@ def __init__(self, war_face_down_count: int = 3) -> None:
             )
 
         if c_face is None:
-            self.player.add_cards_to_bottom(self.pot)
+            self._award_pot(self.player)
             self.state = "idle"
             return StepResult(
                 action="award",
@@ -318,6 +431,21 @@ def __init__(self, war_face_down_count: int = 3) -> None:
             message="War: face-up reveal."
         )
 
+    def _award_pot(self, winner: Player) -> None:
+        # Default path hands the pot over untouched
+        if self.pot_order == "fixed":
+            winner.add_cards_to_bottom(self.pot)
+            return
+        winner.add_cards_to_bottom(self._ordered_pot(winner))
+
+    def _ordered_pot(self, winner: Player) -> list[Card]:
+        winner_cards: set[Card] = set()
+        if self.pot_order == "winner_first":
+            winner_cards = set(self.player_pot)
+            if winner is not self.player:
+                winner_cards = set(self.pot) - winner_cards
+        return order_pot(self.pot, self.pot_order, winner_cards)
+
     @staticmethod
     def _draw_up_to(player: Player, n: int) -> list[Card]:
         out: list[Card] = []
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .card import Card
+from .deck import Deck
+from .engine import BaseEngine, order_pot
+from .player import Player
+from .tracing import ChromeTracer
+
+
+MIN_PLAYERS = 2
+MAX_PLAYERS = 8
+
+
+@dataclass
+class MultiStepResult:
+    action: str  # "draw", "war_start", "war_down", "war_up", "carry_over", "award", "game_over"
+    faces: dict[int, Card]  # player index -> face-up card shown this step
+    down_counts: dict[int, int]  # player index -> face-down cards placed this step
+    pot_size: int
+    round_over: bool
+    game_over: bool
+    winner: Optional[int]  # index of the pot (or game) winner, or None
+    message: str
+    eliminated: list[int] = field(default_factory=list)
+
+
+class MultiGameEngine(BaseEngine[MultiStepResult]):
+    """War for 2-8 players, stepped like GameEngine.
+
+    Only the players tied for the highest card go to war, and a player who
+    runs out of cards is eliminated at the end of the round.
+    """
+
+    def __init__(
+        self,
+        num_players: int = 4,
+        war_face_down_count: int = 3,
+        pot_order: str = "fixed",
+        tracer: Optional[ChromeTracer] = None,
+    ) -> None:
+        if not MIN_PLAYERS <= num_players <= MAX_PLAYERS:
+            raise ValueError(
+                f"num_players must be between {MIN_PLAYERS} and {MAX_PLAYERS}, got {num_players}"
+            )
+        super().__init__(war_face_down_count, pot_order, tracer)
+
+        self.players = [Player(f"Player {i + 1}") for i in range(num_players)]
+
+        # Indices of players still in the game / still fighting for this pot
+        self.active: list[int] = []
+        self.contenders: list[int] = []
+        # Face-up cards of the contenders, in the same order
+        self.faces: list[Card] = []
+
+        # Who put each pot card in, only tracked when the pot order needs it
+        self._track_pot_owner = pot_order == "winner_first"
+        self.pot_owner: list[int] = []
+
+    def _reset_game(self) -> None:
+        deck = Deck()
+        deck.shuffle()
+
+        for player in self.players:
+            player.clear()
+        self.pot.clear()
+        self.pot_owner.clear()
+        self.contenders = []
+        self.faces = []
+        self.state = "idle"
+
+        # Deal round-robin; with 52 cards the first players may get one extra
+        n = len(self.players)
+        i = 0
+        while not deck.is_empty():
+            card = deck.draw()
+            if card is None:
+                break
+            self.players[i].pile.append(card)
+            i = (i + 1) % n
+
+        self.active = list(range(n))
+
+    def is_game_over(self) -> bool:
+        return len(self.active) <= 1
+
+    def get_scores(self) -> list[int]:
+        return [player.card_count() for player in self.players]
+
+    def _next_step(self) -> MultiStepResult:
+        if self.state == "game_over" or self.is_game_over():
+            self.state = "game_over"
+            return self._game_over_result("Game over.")
+
+        if self.state == "idle":
+            return self._start_round_draw()
+
+        if self.state == "compare":
+            return self._step_compare()
+
+        if self.state == "war_down":
+            return self._step_war_down()
+
+        if self.state == "war_up":
+            return self._step_war_up()
+
+        # Fallback
+        self.state = "game_over"
+        return self._game_over_result("Game over (invalid state).")
+
+    def _start_round_draw(self) -> MultiStepResult:
+        self._begin_round()
+
+        # Every active player has at least one card, busted players are already out
+        self.contenders = list(self.active)
+        self.faces = []
+        for i in self.contenders:
+            card = self.players[i].draw_card()
+            self.faces.append(card)
+            self._add_to_pot(i, card)
+
+        self.state = "compare"
+        return MultiStepResult(
+            action="draw",
+            faces=dict(zip(self.contenders, self.faces)),
+            down_counts={},
+            pot_size=len(self.pot),
+            round_over=False,
+            game_over=False,
+            winner=None,
+            message="Draw."
+        )
+
+    def _step_compare(self) -> MultiStepResult:
+        # Single pass: highest rank so far and everyone holding it
+        best = -1
+        tied: list[int] = []
+        for i, card in zip(self.contenders, self.faces):
+            value = card.value
+            if value > best:
+                best = value
+                tied = [i]
+            elif value == best:
+                tied.append(i)
+
+        faces = dict(zip(self.contenders, self.faces))
+
+        if len(tied) == 1:
+            return self._award(tied[0], faces, f"{self.players[tied[0]].name} wins the pot.")
+
+        # Tie -> only the tied players go to war
+        self.contenders = tied
+        self.faces = [faces[i] for i in tied]
+        self.state = "war_down"
+        names = ", ".join(self.players[i].name for i in tied)
+        return MultiStepResult(
+            action="war_start",
+            faces=faces,
+            down_counts={},
+            pot_size=len(self.pot),
+            round_over=False,
+            game_over=False,
+            winner=None,
+            message=f"War between {names}!"
+        )
+
+    def _step_war_down(self) -> MultiStepResult:
+        # Each contender puts N face-down (as many as possible)
+        down_counts: dict[int, int] = {}
+        for i in self.contenders:
+            player = self.players[i]
+            placed = 0
+            while placed < self.war_face_down_count:
+                card = player.draw_card()
+                if card is None:
+                    break
+                self._add_to_pot(i, card)
+                placed += 1
+            down_counts[i] = placed
+
+        self.state = "war_up"
+        return MultiStepResult(
+            action="war_down",
+            faces=dict(zip(self.contenders, self.faces)),
+            down_counts=down_counts,
+            pot_size=len(self.pot),
+            round_over=False,
+            game_over=False,
+            winner=None,
+            message="War: face-down cards placed."
+        )
+
+    def _step_war_up(self) -> MultiStepResult:
+        # Each contender puts 1 face-up; whoever cannot drops out of the war
+        still_in: list[int] = []
+        faces: list[Card] = []
+        for i in self.contenders:
+            card = self.players[i].draw_card()
+            if card is None:
+                continue
+            self._add_to_pot(i, card)
+            still_in.append(i)
+            faces.append(card)
+
+        if not still_in:
+            self.contenders = []
+            self.faces = []
+            eliminated = self._eliminate_busted()
+
+            if len(self.active) == 1:
+                # Only a player who sat out the war is left: pot and game are theirs
+                winner = self.active[0]
+                pot_size = len(self.pot)
+                self._give_pot(winner)
+                self.state = "game_over"
+                return MultiStepResult(
+                    action="game_over",
+                    faces={},
+                    down_counts={},
+                    pot_size=pot_size,
+                    round_over=True,
+                    game_over=True,
+                    winner=winner,
+                    message=(
+                        "Game over: everyone at war ran out of cards, "
+                        f"{self.players[winner].name} takes the pot."
+                    ),
+                    eliminated=eliminated,
+                )
+
+            if not self.active:
+                self.state = "game_over"
+                return MultiStepResult(
+                    action="game_over",
+                    faces={},
+                    down_counts={},
+                    pot_size=len(self.pot),
+                    round_over=True,
+                    game_over=True,
+                    winner=None,
+                    message="Game over: every player ran out of cards during war.",
+                    eliminated=eliminated,
+                )
+
+            # Nobody could reveal: the pot carries over to the next round
+            self.state = "idle"
+            return MultiStepResult(
+                action="carry_over",
+                faces={},
+                down_counts={},
+                pot_size=len(self.pot),
+                round_over=True,
+                game_over=False,
+                winner=None,
+                message="War: nobody had a face-up card, the pot carries over.",
+                eliminated=eliminated,
+            )
+
+        self.contenders = still_in
+        self.faces = faces
+        revealed = dict(zip(still_in, faces))
+
+        if len(still_in) == 1:
+            winner = still_in[0]
+            return self._award(
+                winner, revealed,
+                f"War resolved: only {self.players[winner].name} had a face-up card."
+            )
+
+        # Reveal now, compare next step
+        self.state = "compare"
+        return MultiStepResult(
+            action="war_up",
+            faces=revealed,
+            down_counts={},
+            pot_size=len(self.pot),
+            round_over=False,
+            game_over=False,
+            winner=None,
+            message="War: face-up reveal."
+        )
+
+    def _add_to_pot(self, owner: int, card: Card) -> None:
+        self.pot.append(card)
+        if self._track_pot_owner:
+            self.pot_owner.append(owner)
+
+    def _award(self, winner: int, faces: dict[int, Card], message: str) -> MultiStepResult:
+        pot_size = len(self.pot)
+        self._give_pot(winner)
+
+        eliminated = self._eliminate_busted()
+        self.state = "idle"
+        return MultiStepResult(
+            action="award",
+            faces=faces,
+            down_counts={},
+            pot_size=pot_size,
+            round_over=True,
+            game_over=self.is_game_over(),
+            winner=winner,
+            message=message,
+            eliminated=eliminated,
+        )
+
+    def _give_pot(self, winner: int) -> None:
+        player = self.players[winner]
+        if self.pot_order == "fixed":
+            player.add_cards_to_bottom(self.pot)
+        else:
+            winner_cards = {
+                card for card, owner in zip(self.pot, self.pot_owner) if owner == winner
+            }
+            player.add_cards_to_bottom(order_pot(self.pot, self.pot_order, winner_cards))
+        self.pot.clear()
+        self.pot_owner.clear()
+
+    def _eliminate_busted(self) -> list[int]:
+        busted = [i for i in self.active if not self.players[i].has_cards()]
+        if busted:
+            self.active = [i for i in self.active if self.players[i].has_cards()]
+        return busted
+
+    def _game_over_result(self, message: str) -> MultiStepResult:
+        return MultiStepResult(
+            action="game_over",
+            faces={},
+            down_counts={},
+            pot_size=len(self.pot),
+            round_over=True,
+            game_over=True,
+            winner=self._who_wins_game(),
+            message=message
+        )
+
+    def _who_wins_game(self) -> Optional[int]:
+        if len(self.active) == 1:
+            return self.active[0]
+        return None
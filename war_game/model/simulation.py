@@ -0,0 +1,164 @@
+"""Headless multi-process simulation of many games.
+
+Each worker writes one fixed-size outcome record per game straight into a
+preallocated shared memory segment; the parent reads the records in place.
+Nothing is pickled on the way back.
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+import random
+import struct
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Optional
+
+from .engine import GameEngine, validate_pot_order
+
+
+# Record layout: one C int per field, RECORD_FIELDS fields per game
+TYPECODE = "i"
+ITEM_SIZE = struct.calcsize(TYPECODE)
+RECORD_FIELDS = 3
+WINNER, ROUNDS, WARS = range(RECORD_FIELDS)
+
+# Winner codes stored in the WINNER field
+NO_WINNER = 0
+PLAYER_WINS = 1
+CPU_WINS = 2
+
+WINNER_CODES = {None: NO_WINNER, "player": PLAYER_WINS, "cpu": CPU_WINS}
+
+
+@dataclass
+class SimulationSummary:
+    games: int
+    player_wins: int
+    cpu_wins: int
+    unfinished: int
+    total_rounds: int
+    total_wars: int
+
+    @property
+    def avg_rounds(self) -> float:
+        return self.total_rounds / self.games if self.games else 0.0
+
+
+def play_game(engine: GameEngine, max_rounds: int) -> tuple[int, int, int]:
+    """plays one game, returns (winner code, rounds, wars)
+
+    Games still running after max_rounds are cut off with NO_WINNER.
+    """
+    engine.reset_game()
+    rounds = 0
+    wars = 0
+    while rounds < max_rounds:
+        result = engine.next_step()
+        if result.action == "war_start":
+            wars += 1
+        if result.game_over:
+            return WINNER_CODES[result.winner], rounds, wars
+        if result.round_over:
+            rounds += 1
+    return NO_WINNER, rounds, wars
+
+
+def _worker(
+    shm_name: str,
+    first: int,
+    count: int,
+    pot_order: str,
+    max_rounds: int,
+    seed: Optional[int],
+) -> None:
+    # Forked workers inherit the parent's random state, so always reseed
+    random.seed(seed)
+    engine = GameEngine(war_face_down_count=3, pot_order=pot_order)
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buf = shm.buf.cast(TYPECODE)
+    try:
+        for game in range(first, first + count):
+            base = game * RECORD_FIELDS
+            buf[base + WINNER], buf[base + ROUNDS], buf[base + WARS] = play_game(engine, max_rounds)
+    finally:
+        buf.release()
+        shm.close()
+
+
+def summarize(records: memoryview) -> SimulationSummary:
+    """aggregates a record view without copying it"""
+    games = len(records) // RECORD_FIELDS
+    winners = records[WINNER::RECORD_FIELDS]
+    player_wins = cpu_wins = 0
+    for code in winners:
+        if code == PLAYER_WINS:
+            player_wins += 1
+        elif code == CPU_WINS:
+            cpu_wins += 1
+    return SimulationSummary(
+        games=games,
+        player_wins=player_wins,
+        cpu_wins=cpu_wins,
+        unfinished=games - player_wins - cpu_wins,
+        total_rounds=sum(records[ROUNDS::RECORD_FIELDS]),
+        total_wars=sum(records[WARS::RECORD_FIELDS]),
+    )
+
+
+def run_simulation(
+    games: int,
+    workers: int = 0,
+    pot_order: str = "fixed",
+    max_rounds: int = 5000,
+    seed: Optional[int] = None,
+) -> SimulationSummary:
+    """simulates `games` games across `workers` processes (0 = one per CPU)"""
+    validate_pot_order(pot_order)
+    if games <= 0:
+        return SimulationSummary(
+            games=0, player_wins=0, cpu_wins=0, unfinished=0, total_rounds=0, total_wars=0
+        )
+
+    workers = workers or mp.cpu_count()
+    workers = max(1, min(workers, games))
+
+    shm = shared_memory.SharedMemory(create=True, size=games * RECORD_FIELDS * ITEM_SIZE)
+    try:
+        # Each worker owns a contiguous slice of game records
+        per_worker, extra = divmod(games, workers)
+        procs: list[mp.Process] = []
+        try:
+            first = 0
+            for i in range(workers):
+                count = per_worker + (1 if i < extra else 0)
+                worker_seed = None if seed is None else seed + i
+                proc = mp.Process(
+                    target=_worker,
+                    args=(shm.name, first, count, pot_order, max_rounds, worker_seed),
+                )
+                proc.start()
+                procs.append(proc)
+                first += count
+
+            for proc in procs:
+                proc.join()
+                if proc.exitcode != 0:
+                    raise RuntimeError(f"Simulation worker exited with code {proc.exitcode}")
+        finally:
+            # Never unlink the segment while a worker may still be writing to it
+            for proc in procs:
+                if proc.is_alive():
+                    proc.terminate()
+                proc.join()
+
+        buf = shm.buf.cast(TYPECODE)
+        records = buf[:games * RECORD_FIELDS]
+        try:
+            return summarize(records)
+        finally:
+            records.release()
+            buf.release()
+    finally:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, TextIO
+
+
+class ChromeTracer:
+    """Writes Chrome Trace Event JSON (chrome://tracing, Perfetto).
+
+    Spans are buffered as encoded events and written to disk every
+    `chunk_size` events, so tracing a long run never holds the whole
+    trace in memory.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 512) -> None:
+        self.path = path
+        self.chunk_size = chunk_size
+        self.pid = os.getpid()
+
+        self._file: Optional[TextIO] = open(path, "w", encoding="utf-8")
+        self._file.write("[\n")
+        self._buffer: list[str] = []
+        self._first_chunk = True
+
+    def span(self, name: str, cat: str, **args: object):
+        """context manager recording one complete ("X") event around its body
+
+        It yields the event's args dict, so args only known once the body
+        has run can still be added before the event is written.
+        """
+        return self._span(name, cat, args)
+
+    @contextmanager
+    def _span(self, name: str, cat: str, args: dict) -> Iterator[dict]:
+        start = time.perf_counter_ns()
+        try:
+            yield args
+        finally:
+            end = time.perf_counter_ns()
+            self.add_event(name, cat, start // 1000, (end - start) // 1000, args)
+
+    def add_event(self, name: str, cat: str, ts_us: int, dur_us: int, args: dict) -> None:
+        self._buffer.append(json.dumps({
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": ts_us,
+            "dur": dur_us,
+            "pid": self.pid,
+            "tid": threading.get_ident(),
+            "args": args,
+        }, ensure_ascii=False))
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._file is None or not self._buffer:
+            return
+        if not self._first_chunk:
+            self._file.write(",\n")
+        self._file.write(",\n".join(self._buffer))
+        self._file.flush()
+        self._buffer.clear()
+        self._first_chunk = False
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self.flush()
+        self._file.write("\n]\n")
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> ChromeTracer:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
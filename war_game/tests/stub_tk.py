@@ -0,0 +1,47 @@
+"""Minimal stand-ins for the tkinter widgets WarGameApp uses, so the game
+flow can run without a display."""
+import itertools
+
+
+class StubWidget:
+    def __init__(self, *args, **kwargs) -> None:
+        self.options = dict(kwargs)
+        self._ids = itertools.count(1)
+        # Calls that change what is drawn, for tests to inspect
+        self.config_calls: list[dict] = []
+        self.item_calls: list[tuple[object, dict]] = []
+
+    def __getattr__(self, name):
+        # pack, title, minsize, itemconfigure, move, insert, see, ...
+        return lambda *args, **kwargs: None
+
+    def cget(self, key):
+        return self.options.get(key, "")
+
+    def config(self, **kwargs) -> None:
+        self.config_calls.append(kwargs)
+        self.options.update(kwargs)
+
+    configure = config
+
+    def create_rectangle(self, *args, **kwargs) -> int:
+        return next(self._ids)
+
+    create_text = create_rectangle
+
+    def itemconfigure(self, item, **kwargs) -> None:
+        self.item_calls.append((item, kwargs))
+
+    def bbox(self, tag):
+        return (0, 0, 80, 110)
+
+    def get(self, *args) -> str:
+        return ""
+
+
+def patch_tk(monkeypatch) -> StubWidget:
+    """swaps the tkinter widget classes for stubs, returns a stub root"""
+    import tkinter
+    for name in ("Label", "Frame", "Button", "Canvas", "Text"):
+        monkeypatch.setattr(tkinter, name, StubWidget)
+    return StubWidget()
@@ -0,0 +1,97 @@
+from collections import deque
+
+import pytest
+
+from model.card import Card
+from model.engine import POT_ORDERS, GameEngine
+
+
+def rig(engine: GameEngine, player: str, cpu: str) -> None:
+    """deals fixed piles; player cards are all ♠, CPU cards all ♥
+
+    Both keep a card after the war so the award step is reached.
+    """
+    engine.reset_game()
+    engine.player.pile = deque(Card(rank, "♠") for rank in player.split())
+    engine.cpu.pile = deque(Card(rank, "♥") for rank in cpu.split())
+
+
+def play_war(engine: GameEngine):
+    """draw, war_start, war_down, war_up, award"""
+    results = [engine.next_step() for _ in range(5)]
+    assert [r.action for r in results] == ["draw", "war_start", "war_down", "war_up", "award"]
+    return results[-1]
+
+
+def pile(player) -> list[str]:
+    return [str(card) for card in player.pile]
+
+
+def test_winner_first_puts_the_player_cards_first_on_a_player_win():
+    engine = GameEngine(pot_order="winner_first")
+    rig(engine, "K 2 3 4 A 8", "K 5 6 7 9 3")
+
+    award = play_war(engine)
+
+    assert award.winner == "player"
+    assert pile(engine.player) == [
+        "8♠", "K♠", "2♠", "3♠", "4♠", "A♠", "K♥", "5♥", "6♥", "7♥", "9♥",
+    ]
+
+
+def test_winner_first_puts_the_cpu_cards_first_on_a_cpu_win():
+    engine = GameEngine(pot_order="winner_first")
+    rig(engine, "K 2 3 4 5 8", "K 5 6 7 9 3")
+
+    award = play_war(engine)
+
+    assert award.winner == "cpu"
+    assert pile(engine.cpu) == [
+        "3♥", "K♥", "5♥", "6♥", "7♥", "9♥", "K♠", "2♠", "3♠", "4♠", "5♠",
+    ]
+
+
+def test_by_rank_puts_the_highest_cards_first():
+    engine = GameEngine(pot_order="by_rank")
+    rig(engine, "K 2 3 4 A 8", "K 5 6 7 9 3")
+
+    play_war(engine)
+
+    assert pile(engine.player) == [
+        "8♠", "A♠", "K♠", "K♥", "9♥", "7♥", "6♥", "5♥", "4♠", "3♠", "2♠",
+    ]
+
+
+def test_fixed_keeps_the_pot_in_play_order():
+    engine = GameEngine()
+    rig(engine, "K 2 3 4 A 8", "K 5 6 7 9 3")
+
+    play_war(engine)
+
+    assert pile(engine.player) == [
+        "8♠", "K♠", "K♥", "2♠", "3♠", "4♠", "5♥", "6♥", "7♥", "A♠", "9♥",
+    ]
+
+
+@pytest.mark.parametrize("pot_order", POT_ORDERS)
+def test_cards_are_conserved(pot_order):
+    engine = GameEngine(pot_order=pot_order)
+    for _ in range(10):
+        engine.reset_game()
+        for _ in range(20000):
+            result = engine.next_step()
+            in_piles = sum(engine.get_scores())
+            if engine.in_round():
+                assert in_piles + len(engine.pot) == 52
+            if engine.state == "idle":
+                # The awarded pot list is only cleared on the next draw
+                assert in_piles == 52
+            if result.game_over:
+                # A game can end mid-war when one pile runs dry, pot undistributed
+                assert in_piles in (52, 52 - len(engine.pot))
+                break
+
+
+def test_unknown_pot_order_is_rejected():
+    with pytest.raises(ValueError, match="Unknown pot order"):
+        GameEngine(pot_order="backwards")
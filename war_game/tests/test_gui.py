@@ -0,0 +1,49 @@
+from collections import deque
+
+from model.card import Card
+from tests.stub_tk import patch_tk
+from ui.gui import WarGameApp
+from ui.scheduler import VirtualScheduler
+
+
+def make_app(monkeypatch) -> WarGameApp:
+    root = patch_tk(monkeypatch)
+    return WarGameApp(root, scheduler=VirtualScheduler())
+
+
+def test_refresh_without_engine_change_touches_nothing(monkeypatch):
+    app = make_app(monkeypatch)
+    app.set_status("READY")
+    app.canvas.item_calls.clear()
+    app.score_label.config_calls.clear()
+    app.status_label.config_calls.clear()
+
+    app.refresh_scores()
+    app.refresh_pot()
+    app.set_status("READY")
+
+    assert app.canvas.item_calls == []
+    assert app.score_label.config_calls == []
+    assert app.status_label.config_calls == []
+
+
+def test_war_down_only_changes_state_of_face_down_items(monkeypatch):
+    app = make_app(monkeypatch)
+    app.engine.player.pile = deque(Card(rank, "♠") for rank in "K 2 3 4 A 8".split())
+    app.engine.cpu.pile = deque(Card(rank, "♥") for rank in "K 5 6 7 9 3".split())
+
+    app._animate_round_step()  # draw
+    app._animate_round_step()  # war_start
+    app.canvas.item_calls.clear()
+    app._animate_round_step()  # war_down
+
+    assert app.engine.state == "war_up"
+    state_changes = [(item, opts) for item, opts in app.canvas.item_calls if "state" in opts]
+    down_tags = set(app.player_down_tags) | set(app.cpu_down_tags)
+    assert {item for item, _ in state_changes} == down_tags
+    assert all(opts == {"state": "normal"} for _, opts in state_changes)
+
+    # Showing the same stacks again is a no-op
+    app.canvas.item_calls.clear()
+    app._show_face_down(app.player_down_tags, 3)
+    assert app.canvas.item_calls == []
@@ -0,0 +1,27 @@
+import random
+
+import pytest
+
+from tests.stub_tk import patch_tk
+from ui.harness import run_animated_game
+
+
+@pytest.mark.parametrize("speed", [1.0, 2.0, 3.0, 4.0])
+@pytest.mark.parametrize("seed", range(6))
+def test_animated_game_runs_to_the_end_on_virtual_time(monkeypatch, seed, speed):
+    root = patch_tk(monkeypatch)
+    random.seed(seed)
+
+    report = run_animated_game(root, speed=speed, max_rounds=3000)
+
+    assert report.finished
+    assert report.virtual_seconds > 0
+    assert report.step_timings
+
+
+@pytest.mark.parametrize("speed", [0, -1.5])
+def test_non_positive_speed_is_rejected(monkeypatch, speed):
+    root = patch_tk(monkeypatch)
+
+    with pytest.raises(ValueError):
+        run_animated_game(root, speed=speed)
@@ -0,0 +1,143 @@
+from collections import deque
+
+import pytest
+
+from model.card import Card
+from model.engine import POT_ORDERS, BaseEngine
+from model.multi_engine import MultiGameEngine
+
+
+def rig(engine: MultiGameEngine, *piles: str) -> None:
+    """deals fixed piles, e.g. rig(engine, "K", "K", "5 6"); suits don't matter here"""
+    engine.reset_game()
+    suits = iter("♠♥♦♣" * 13)
+    for player, pile in zip(engine.players, piles):
+        player.pile = deque(Card(rank, next(suits)) for rank in pile.split())
+
+
+def ranks(faces: dict[int, Card]) -> dict[int, str]:
+    return {i: card.rank for i, card in faces.items()}
+
+
+def play_out(engine: MultiGameEngine, max_steps: int = 100) -> list:
+    results = []
+    for _ in range(max_steps):
+        results.append(engine.next_step())
+        if results[-1].game_over:
+            break
+    return results
+
+
+def test_last_player_standing_takes_the_pot_when_all_contenders_bust():
+    engine = MultiGameEngine(3)
+    rig(engine, "K", "K", "5 6")
+
+    results = play_out(engine)
+
+    last = results[-1]
+    assert last.action == "game_over"
+    assert last.winner == 2
+    assert engine.get_scores() == [0, 0, 4]
+    assert engine.pot == []
+    assert "carries over" not in last.message
+
+
+def test_pot_carries_over_when_contenders_bust_and_others_remain():
+    engine = MultiGameEngine(4)
+    rig(engine, "K", "K", "5 6", "4 7")
+
+    results = play_out(engine, max_steps=4)
+
+    assert [r.action for r in results] == ["draw", "war_start", "war_down", "carry_over"]
+    assert results[-1].eliminated == [0, 1]
+    assert len(engine.pot) == 4
+    assert engine.active == [2, 3]
+
+
+@pytest.mark.parametrize("pot_order", POT_ORDERS)
+@pytest.mark.parametrize("num_players", range(2, 9))
+def test_cards_are_conserved(num_players, pot_order):
+    engine = MultiGameEngine(num_players, pot_order=pot_order)
+    for _ in range(10):
+        engine.reset_game()
+        for _ in range(20000):
+            result = engine.next_step()
+            if engine.state == "idle":
+                assert sum(engine.get_scores()) + len(engine.pot) == 52
+            if result.game_over:
+                if result.winner is not None:
+                    assert engine.get_scores()[result.winner] == 52
+                break
+
+
+def test_only_tied_players_go_to_war():
+    engine = MultiGameEngine(4)
+    rig(engine, "K 2 2 2 3", "5 9", "K 2 2 2 A", "3 9")
+
+    draw, war_start, war_down, war_up, award = play_out(engine, max_steps=5)
+
+    assert war_start.action == "war_start"
+    assert engine.players[1].card_count() == 1
+    assert engine.players[3].card_count() == 1
+    assert war_down.down_counts == {0: 3, 2: 3}
+    assert ranks(war_up.faces) == {0: "3", 2: "A"}
+    assert award.action == "award"
+    assert award.winner == 2
+    assert award.pot_size == 12
+    assert award.eliminated == [0]
+
+
+def test_three_way_war_is_resolved_among_the_tied_players():
+    engine = MultiGameEngine(3)
+    rig(engine, "Q 2 2 2 7 2 2 2 5", "Q 2 2 2 7 2 2 2 9", "Q 2 2 2 4 4")
+
+    results = play_out(engine, max_steps=9)
+
+    actions = [r.action for r in results]
+    assert actions == [
+        "draw", "war_start", "war_down", "war_up",
+        "war_start", "war_down", "war_up", "award", "draw",
+    ]
+    # Second war is between players 0 and 1 only, their 7s tied
+    assert ranks(results[4].faces) == {0: "7", 1: "7", 2: "4"}
+    assert results[5].down_counts == {0: 3, 1: 3}
+    assert ranks(results[6].faces) == {0: "5", 1: "9"}
+    assert results[7].winner == 1
+    assert results[7].eliminated == [0]
+    assert results[8].faces.keys() == {1, 2}
+
+
+def test_tied_player_without_a_face_up_card_drops_out_of_the_war():
+    engine = MultiGameEngine(3)
+    rig(engine, "J 2 2 2", "J 2 2 2 5", "3 8")
+
+    results = play_out(engine, max_steps=4)
+
+    war_up = results[-1]
+    assert war_up.action == "award"
+    assert war_up.winner == 1
+    assert war_up.eliminated == [0]
+    assert engine.active == [1, 2]
+
+
+def test_busted_players_are_eliminated_until_one_is_left():
+    engine = MultiGameEngine(3)
+    rig(engine, "A", "2", "3")
+
+    draw, award = play_out(engine)
+    game_over = engine.next_step()
+
+    assert award.winner == 0
+    assert award.eliminated == [1, 2]
+    assert award.game_over
+    assert game_over.action == "game_over"
+    assert game_over.winner == 0
+
+
+def test_engine_missing_a_step_method_fails_at_construction():
+    class Incomplete(BaseEngine):
+        def _reset_game(self) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete(3, "fixed", None)
@@ -0,0 +1,33 @@
+from ui.scheduler import VirtualScheduler
+
+
+def test_callbacks_run_in_due_order_and_advance_time():
+    scheduler = VirtualScheduler()
+    seen = []
+    scheduler.after(500, lambda: seen.append(("late", scheduler.now())))
+    scheduler.after(100, lambda: seen.append(("early", scheduler.now())))
+
+    assert scheduler.run() == 2
+    assert seen == [("early", 0.1), ("late", 0.5)]
+
+
+def test_cancelled_callback_does_not_run():
+    scheduler = VirtualScheduler()
+    seen = []
+    handle = scheduler.after(10, lambda: seen.append("cancelled"))
+    scheduler.after(20, lambda: seen.append("kept"))
+    scheduler.cancel(handle)
+
+    scheduler.run()
+
+    assert seen == ["kept"]
+
+
+def test_repeated_delays_land_exactly_on_the_due_time():
+    scheduler = VirtualScheduler()
+    due = 0.0
+    for delay_ms in (650, 450, 600, 700, 700, 900) * 50:
+        due += delay_ms / 1000
+        scheduler.after(delay_ms, lambda: None)
+        scheduler.run()
+    assert scheduler.time_ms == round(due * 1000)
@@ -0,0 +1,25 @@
+import pytest
+
+from model.simulation import run_simulation
+
+
+def test_zero_games_gives_an_empty_summary():
+    summary = run_simulation(0)
+
+    assert summary.games == 0
+    assert summary.avg_rounds == 0.0
+
+
+def test_every_game_is_recorded_and_seeded_runs_repeat():
+    first = run_simulation(7, workers=3, pot_order="by_rank", seed=5)
+    second = run_simulation(7, workers=3, pot_order="by_rank", seed=5)
+
+    assert first == second
+    assert first.games == 7
+    assert first.player_wins + first.cpu_wins + first.unfinished == 7
+    assert first.total_rounds > 0
+
+
+def test_unknown_pot_order_is_rejected_before_starting_workers():
+    with pytest.raises(ValueError, match="Unknown pot order"):
+        run_simulation(4, workers=2, pot_order="backwards")
@@ -0,0 +1,43 @@
+import json
+import random
+
+from model.engine import GameEngine
+from model.tracing import ChromeTracer
+from tests.stub_tk import patch_tk
+from ui.gui import WarGameApp
+
+
+def load_events(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_trace_is_valid_json_across_chunks(tmp_path):
+    path = tmp_path / "trace.json"
+    random.seed(0)
+    with ChromeTracer(str(path), chunk_size=7) as tracer:
+        engine = GameEngine(tracer=tracer)
+        engine.reset_game()
+        for _ in range(50):
+            engine.next_step()
+
+    events = load_events(path)
+    assert len(events) == 51
+    assert events[0]["name"] == "reset_game"
+    assert all(event["ph"] == "X" for event in events)
+    assert events[1]["name"] == "next_step:idle"
+    assert events[1]["args"] == {"game_id": 1, "round": 1}
+
+
+def test_ui_step_span_has_same_round_as_its_engine_span(monkeypatch, tmp_path):
+    root = patch_tk(monkeypatch)
+    path = tmp_path / "trace.json"
+    random.seed(0)
+    with ChromeTracer(str(path)) as tracer:
+        app = WarGameApp(root, tracer=tracer)
+        app._animate_round_step()
+
+    events = load_events(path)
+    engine_span = next(e for e in events if e["name"] == "next_step:idle")
+    ui_span = next(e for e in events if e["name"] == "_animate_round_step")
+    assert ui_span["args"] == engine_span["args"] == {"game_id": 1, "round": 1}
@@ -1,26 +1,86 @@
+import functools
+import math
+import time
 import tkinter as tk
+from model.card import Card
 from model.engine import GameEngine
-
-
-def build_face_down_text(n: int) -> str:
-    if n <= 0:
-        return ""
-    return " ".join(["XX"] * n)
+from model.tracing import ChromeTracer
+from ui.scheduler import Scheduler, TkScheduler
+
+
+# Board geometry (px)
+BOARD_W = 520
+BOARD_H = 380
+CARD_W = 80
+CARD_H = 110
+DOWN_W = 40
+DOWN_H = 56
+DOWN_SPREAD = 22
+
+PILE_X = 70
+SLOT_X = BOARD_W // 2
+DOWN_X = 350
+CPU_Y = 95
+PLAYER_Y = 285
+POT_Y = BOARD_H // 2
+
+# Animation
+FRAME_MS = 16
+SLIDE_MS = 260
+# Slack (s) when checking whether a step is due, absorbs float rounding
+DUE_EPSILON = 1e-6
+
+RED_SUITS = ("♥", "♦")
+
+
+def traced(method):
+    """records a "ui" span for the method when the app has a tracer
+
+    game_id and round are read after the method runs, so a step that starts
+    a new round is tagged with that round, like its nested engine span.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.tracer is None:
+            return method(self, *args, **kwargs)
+        with self.tracer.span(method.__name__, "ui") as span_args:
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                span_args["game_id"] = self.engine.game_id
+                span_args["round"] = self.engine.round_number
+    return wrapper
 
 
 class WarGameApp:
-    def __init__(self, root: tk.Tk) -> None:
+    def __init__(
+        self,
+        root: tk.Tk,
+        scheduler: Scheduler | None = None,
+        speed: float = 1.0,
+        tracer: ChromeTracer | None = None,
+    ) -> None:
+        if speed <= 0:
+            raise ValueError(f"speed must be positive, got {speed}")
+
         self.root = root
         self.root.title("War - Card Game")
-        self.root.minsize(520, 520)
+        self.root.minsize(560, 700)
 
-        self.engine = GameEngine(war_face_down_count=3)
+        self.tracer = tracer
+        self.engine = GameEngine(war_face_down_count=3, tracer=tracer)
         self.engine.reset_game()
 
         # Flow control
         self.is_busy = False
+        self.scheduler = scheduler if scheduler is not None else TkScheduler(root)
+        # >1 plays faster: divides every step delay and slide duration
+        self.speed = speed
 
-        # Timing (ms)
+        # (action, seconds) per engine step when set to a list
+        self.step_timings: list[tuple[str, float]] | None = None
+
+        # Timing (ms): how long each step stays on screen once its slides finish
         self.DELAY_DRAW = 650
         self.DELAY_COMPARE = 450
         self.DELAY_WAR_START = 600
@@ -29,11 +89,25 @@ class WarGameApp:
         self.DELAY_AWARD = 900
 
         # Simple theme
-        self.bg = "#0f172a"     
-        self.panel = "#111827"   
-        self.card_bg = "#0b1220" 
-        self.text = "#e5e7eb"    
-        self.muted = "#9ca3af"   
+        self.bg = "#0f172a"
+        self.panel = "#111827"
+        self.card_bg = "#0b1220"
+        self.card_back = "#1e3a8a"
+        self.border = "#334155"
+        self.text = "#e5e7eb"
+        self.muted = "#9ca3af"
+        self.red = "#f87171"
+
+        # Canvas item options as last configured, so unchanged items are skipped
+        self._item_cache: dict[int, dict[str, object]] = {}
+        # Tagged item groups are cached under the id of their first item
+        self._tag_keys: dict[str, int] = {}
+
+        # Frame loop: active slides and when the next engine step is due
+        self._slides: list[dict] = []
+        self._loop_id: str | None = None
+        self._last_frame = 0.0
+        self._next_step_at: float | None = None
 
         self.root.configure(bg=self.bg)
 
@@ -56,24 +130,25 @@ class WarGameApp:
         )
         subtitle.pack(pady=(0, 10))
 
-        #main board 
-        self.board = tk.Frame(root, bg=self.bg)
-        self.board.pack(fill="both", expand=True, padx=16, pady=10)
+        #main board
+        self.canvas = tk.Canvas(
+            root,
+            width=BOARD_W,
+            height=BOARD_H,
+            bg=self.panel,
+            bd=0,
+            highlightthickness=0
+        )
+        self.canvas.pack(padx=16, pady=(10, 12))
 
-        #CPU area
-        self.cpu_area = self._build_player_area(self.board, "CPU")
-        self.cpu_area.pack(fill="x", pady=(0, 12))
+        self._build_board()
 
         #Center status area
-        self.center_area = tk.Frame(self.board, bg=self.panel, bd=0, highlightthickness=0)
-        self.center_area.pack(fill="x", pady=(0, 12))
+        self.center_area = tk.Frame(root, bg=self.panel, bd=0, highlightthickness=0)
+        self.center_area.pack(fill="x", padx=16)
 
         self._build_center_area(self.center_area)
 
-        #Player area
-        self.player_area = self._build_player_area(self.board, "PLAYER")
-        self.player_area.pack(fill="x")
-
         #Bottom controls
         self.controls = tk.Frame(root, bg=self.bg)
         self.controls.pack(fill="x", padx=16, pady=(10, 14))
@@ -107,13 +182,6 @@ class WarGameApp:
         )
         self.score_label.pack(side="right")
 
-        # Map labels for easy update
-        self.cpu_card_label = self.cpu_area.card_label
-        self.cpu_down_label = self.cpu_area.down_label
-
-        self.player_card_label = self.player_area.card_label
-        self.player_down_label = self.player_area.down_label
-
         self.refresh_scores()
         self.refresh_pot()
         self._push_log("New game. Press Play.")
@@ -124,56 +192,78 @@ class WarGameApp:
 
     #ui builders
 
-    def _build_player_area(self, parent: tk.Widget, name: str) -> tk.Frame:
-        frame = tk.Frame(parent, bg=self.panel, padx=14, pady=12)
-        frame.configure(highlightthickness=0)
+    def _build_board(self) -> None:
+        # Every item is created once here; later steps only reconfigure or move them
+        self.canvas.create_text(
+            14, 12, text="CPU", anchor="nw",
+            font=("Arial", 13, "bold"), fill=self.text
+        )
+        self.canvas.create_text(
+            14, BOARD_H - 12, text="PLAYER", anchor="sw",
+            font=("Arial", 13, "bold"), fill=self.text
+        )
+
+        self.cpu_pile_text = self._build_pile("cpu_pile", CPU_Y)
+        self.player_pile_text = self._build_pile("player_pile", PLAYER_Y)
 
-        header = tk.Frame(frame, bg=self.panel)
-        header.pack(fill="x")
+        self.cpu_card_text = self._build_card("cpu_card", SLOT_X, CPU_Y)
+        self.player_card_text = self._build_card("player_card", SLOT_X, PLAYER_Y)
 
-        name_label = tk.Label(
-            header,
-            text=name,
-            font=("Arial", 13, "bold"),
-            bg=self.panel,
-            fg=self.text
-        )
-        name_label.pack(side="left")
+        self.cpu_down_tags = self._build_face_down_stack("cpu_down", CPU_Y)
+        self.player_down_tags = self._build_face_down_stack("player_down", PLAYER_Y)
 
-        down_label = tk.Label(
-            frame,
-            text="",
-            font=("Consolas", 12),
-            bg=self.panel,
-            fg=self.muted
+        self.canvas.create_rectangle(
+            SLOT_X - 60, POT_Y - 16, SLOT_X + 60, POT_Y + 16,
+            fill=self.card_bg, outline=self.border, width=2
         )
-        down_label.pack(anchor="w", pady=(8, 6))
-
-        # Card slot
-        slot = tk.Frame(
-            frame,
-            bg=self.card_bg,
-            bd=0,
-            highlightbackground="#334155",
-            highlightthickness=2,
-            padx=10,
-            pady=10
+        self.pot_text = self.canvas.create_text(
+            SLOT_X, POT_Y, text="Pot: 0",
+            font=("Arial", 12, "bold"), fill=self.text
         )
-        slot.pack(fill="x")
+        self._remember(self.pot_text, text="Pot: 0")
 
-        card_label = tk.Label(
-            slot,
-            text="--",
-            font=("Arial", 36, "bold"),
-            bg=self.card_bg,
-            fg=self.text
+    def _build_pile(self, tag: str, y: int) -> int:
+        self.canvas.create_rectangle(
+            *self._card_box(PILE_X, y, CARD_W, CARD_H),
+            fill=self.card_back, outline=self.border, width=2, tags=(tag,)
+        )
+        count = self.canvas.create_text(
+            PILE_X, y, text="", font=("Arial", 16, "bold"),
+            fill=self.text, tags=(tag,)
         )
-        card_label.pack()
+        self._remember(count, text="")
+        return count
 
-        # Attach for easy access
-        frame.down_label = down_label
-        frame.card_label = card_label
-        return frame
+    def _build_card(self, tag: str, x: int, y: int) -> int:
+        self.canvas.create_rectangle(
+            *self._card_box(x, y, CARD_W, CARD_H),
+            fill=self.card_bg, outline=self.border, width=2, tags=(tag,)
+        )
+        face = self.canvas.create_text(
+            x, y, text="--", font=("Arial", 28, "bold"),
+            fill=self.text, tags=(tag,)
+        )
+        self._remember(face, text="--", fill=self.text)
+        return face
+
+    def _build_face_down_stack(self, prefix: str, y: int) -> list[str]:
+        tags = []
+        for i in range(self.engine.war_face_down_count):
+            tag = f"{prefix}_{i}"
+            x = DOWN_X + i * DOWN_SPREAD
+            rect = self.canvas.create_rectangle(
+                *self._card_box(x, y, DOWN_W, DOWN_H),
+                fill=self.card_back, outline=self.border, width=2,
+                state="hidden", tags=(tag,)
+            )
+            self.canvas.create_text(
+                x, y, text="XX", font=("Consolas", 12),
+                fill=self.muted, state="hidden", tags=(tag,)
+            )
+            self._remember(rect, state="hidden")
+            self._tag_keys[tag] = rect
+            tags.append(tag)
+        return tags
 
     def _build_center_area(self, parent: tk.Widget) -> None:
         parent.configure(padx=14, pady=12, bg=self.panel)
@@ -181,15 +271,6 @@ class WarGameApp:
         top = tk.Frame(parent, bg=self.panel)
         top.pack(fill="x")
 
-        self.pot_label = tk.Label(
-            top,
-            text="Pot: 0",
-            font=("Arial", 12, "bold"),
-            bg=self.panel,
-            fg=self.text
-        )
-        self.pot_label.pack(side="left")
-
         self.status_label = tk.Label(
             top,
             text="",
@@ -209,7 +290,7 @@ class WarGameApp:
             fg=self.text,
             bd=0,
             highlightthickness=2,
-            highlightbackground="#334155"
+            highlightbackground=self.border
         )
         self.log_box.pack(fill="x", pady=(10, 0))
         self.log_box.config(state="disabled")
@@ -234,18 +315,52 @@ class WarGameApp:
                 bd=0
             )
 
+    @staticmethod
+    def _card_box(x: int, y: int, w: int, h: int) -> tuple[int, int, int, int]:
+        return x - w // 2, y - h // 2, x + w // 2, y + h // 2
+
+    #canvas helpers
+
+    def _remember(self, item: int, **options: object) -> None:
+        self._item_cache.setdefault(item, {}).update(options)
+
+    def _set_item(self, item: int | str, **options: object) -> None:
+        key = self._tag_keys[item] if isinstance(item, str) else item
+        cached = self._item_cache.setdefault(key, {})
+        changed = {k: v for k, v in options.items() if cached.get(k) != v}
+        if changed:
+            self.canvas.itemconfigure(item, **changed)
+            cached.update(changed)
+
+    def _show_card(self, face: int, card: Card) -> None:
+        fill = self.red if card.suit in RED_SUITS else self.text
+        self._set_item(face, text=str(card), fill=fill)
+
+    def _show_face_down(self, tags: list[str], count: int) -> None:
+        for i, tag in enumerate(tags):
+            self._set_item(tag, state="normal" if i < count else "hidden")
+
     #UI helpers
 
+    @traced
     def refresh_scores(self) -> None:
         p, c = self.engine.get_scores()
-        self.score_label.config(text=f"Cards  Player: {p}   CPU: {c}")
+        text = f"Cards  Player: {p}   CPU: {c}"
+        if self.score_label.cget("text") != text:
+            self.score_label.config(text=text)
+        self._set_item(self.player_pile_text, text=str(p))
+        self._set_item(self.cpu_pile_text, text=str(c))
 
     def refresh_pot(self) -> None:
-        self.pot_label.config(text=f"Pot: {len(self.engine.pot)}")
+        self._set_item(self.pot_text, text=f"Pot: {len(self.engine.pot)}")
 
     def clear_face_down(self) -> None:
-        self.cpu_down_label.config(text="")
-        self.player_down_label.config(text="")
+        self._show_face_down(self.cpu_down_tags, 0)
+        self._show_face_down(self.player_down_tags, 0)
+
+    def set_status(self, text: str) -> None:
+        if self.status_label.cget("text") != text:
+            self.status_label.config(text=text)
 
     def set_busy(self, busy: bool) -> None:
         self.is_busy = busy
@@ -257,6 +372,7 @@ class WarGameApp:
             else:
                 self.play_button.config(state=tk.NORMAL)
 
+    @traced
     def _push_log(self, line: str) -> None:
         self.log_box.config(state="normal")
         content = self.log_box.get("1.0", "end").strip().splitlines()
@@ -270,40 +386,115 @@ class WarGameApp:
         self.log_box.config(state="disabled")
         self.log_box.see("end")
 
+    #Animation
+
+    def _slide_in(self, tag: str, from_x: int, to_x: int) -> None:
+        # Jump the item group back to its start, then let the frame loop ease it over
+        x1, _, x2, _ = self.canvas.bbox(tag)
+        self.canvas.move(tag, from_x - (x1 + x2) // 2, 0)
+        self._slides = [s for s in self._slides if s["tag"] != tag]
+        self._slides.append({
+            "tag": tag,
+            "from_x": from_x,
+            "to_x": to_x,
+            "x": from_x,
+            "elapsed": 0.0,
+        })
+
+    def _finish_slides(self) -> None:
+        for slide in self._slides:
+            self.canvas.move(slide["tag"], slide["to_x"] - slide["x"], 0)
+        self._slides.clear()
+
+    def _advance_slides(self, dt_ms: float) -> None:
+        still_running = []
+        for slide in self._slides:
+            slide["elapsed"] += dt_ms
+            t = min(slide["elapsed"] * self.speed / SLIDE_MS, 1.0)
+            eased = 1 - (1 - t) ** 3
+            x = round(slide["from_x"] + (slide["to_x"] - slide["from_x"]) * eased)
+            if x != slide["x"]:
+                self.canvas.move(slide["tag"], x - slide["x"], 0)
+                slide["x"] = x
+            if t < 1.0:
+                still_running.append(slide)
+        self._slides = still_running
+
+    def _start_loop(self) -> None:
+        if self._loop_id is None:
+            self._last_frame = self.scheduler.now()
+            self._loop_id = self.scheduler.after(FRAME_MS, self._on_frame)
+
+    def _stop_loop(self) -> None:
+        if self._loop_id is not None:
+            self.scheduler.cancel(self._loop_id)
+            self._loop_id = None
+        self._finish_slides()
+        self._next_step_at = None
+
+    def _on_frame(self) -> None:
+        # Single after() loop: moves slides, then runs the next step once they settle
+        now = self.scheduler.now()
+        self._advance_slides((now - self._last_frame) * 1000)
+        self._last_frame = now
+
+        due = self._next_step_at is not None and now >= self._next_step_at - DUE_EPSILON
+        if not self._slides and due:
+            self._next_step_at = None
+            self._animate_round_step()
+
+        if self._slides:
+            self._loop_id = self.scheduler.after(FRAME_MS, self._on_frame)
+        elif self._next_step_at is not None:
+            # Nothing to draw until the next step is due, so sleep until then
+            # Round up and always wait at least 1 ms so time is sure to move forward
+            wait_ms = max(1, math.ceil((self._next_step_at - self.scheduler.now()) * 1000))
+            self._loop_id = self.scheduler.after(wait_ms, self._on_frame)
+        else:
+            self._loop_id = None
+
     #Game flow
 
     def on_play(self) -> None:
         if self.is_busy:
             return
         if self.engine.state == "game_over":
-            self.status_label.config(text="Game over.")
+            self.set_status("Game over.")
             self.play_button.config(state=tk.DISABLED)
             return
 
         self.set_busy(True)
         self._animate_round_step()
 
+    @traced
     def _animate_round_step(self) -> None:
+        started = time.perf_counter()
         result = self.engine.next_step()
 
         # Update cards on draw and war_up
         if result.action in ("draw", "war_up"):
             if result.player_card is not None:
-                self.player_card_label.config(text=str(result.player_card))
+                self._show_card(self.player_card_text, result.player_card)
+                self._slide_in("player_card", PILE_X, SLOT_X)
             if result.cpu_card is not None:
-                self.cpu_card_label.config(text=str(result.cpu_card))
+                self._show_card(self.cpu_card_text, result.cpu_card)
+                self._slide_in("cpu_card", PILE_X, SLOT_X)
 
         # War down placeholders
         if result.action == "war_down":
-            self.player_down_label.config(text=build_face_down_text(result.player_down_count))
-            self.cpu_down_label.config(text=build_face_down_text(result.cpu_down_count))
+            self._show_face_down(self.player_down_tags, result.player_down_count)
+            self._show_face_down(self.cpu_down_tags, result.cpu_down_count)
+            for i in range(result.player_down_count):
+                self._slide_in(self.player_down_tags[i], PILE_X, DOWN_X + i * DOWN_SPREAD)
+            for i in range(result.cpu_down_count):
+                self._slide_in(self.cpu_down_tags[i], PILE_X, DOWN_X + i * DOWN_SPREAD)
 
         # Clear placeholders when round ends
         if result.round_over:
             self.clear_face_down()
 
         # Status + counters
-        self.status_label.config(text=result.action.upper())
+        self.set_status(result.action.upper())
         self.refresh_scores()
         self.refresh_pot()
 
@@ -311,23 +502,32 @@ class WarGameApp:
         if result.message:
             self._push_log(result.message)
 
+        if self.step_timings is not None:
+            self.step_timings.append((result.action, time.perf_counter() - started))
+
         # Stop conditions
         if result.game_over or self.engine.state == "game_over":
             self._push_log("Game over. Press Restart.")
-            self.status_label.config(text="GAME OVER")
+            self.set_status("GAME OVER")
             self.set_busy(False)
             self.play_button.config(state=tk.DISABLED)
+            self._start_loop()
             return
 
         if self.engine.state == "idle":
             # Round finished
             self.set_busy(False)
+            self._start_loop()
             return
 
         delay = self._delay_for_action(result.action)
-        self.root.after(delay, self._animate_round_step)
+        self._next_step_at = self.scheduler.now() + delay / 1000
+        self._start_loop()
 
     def _delay_for_action(self, action: str) -> int:
+        return round(self._base_delay_for_action(action) / self.speed)
+
+    def _base_delay_for_action(self, action: str) -> int:
         if action == "draw":
             return self.DELAY_DRAW
         if action == "compare":
@@ -346,11 +546,12 @@ class WarGameApp:
         if self.is_busy:
             return
 
+        self._stop_loop()
         self.engine.reset_game()
-        self.cpu_card_label.config(text="--")
-        self.player_card_label.config(text="--")
+        self._set_item(self.cpu_card_text, text="--", fill=self.text)
+        self._set_item(self.player_card_text, text="--", fill=self.text)
         self.clear_face_down()
-        self.status_label.config(text="READY")
+        self.set_status("READY")
         self.refresh_scores()
         self.refresh_pot()
 
@@ -363,7 +564,12 @@ class WarGameApp:
         self.play_button.config(state=tk.NORMAL)
 
 
-def run_app() -> None:
+def run_app(trace_path: str | None = None) -> None:
     root = tk.Tk()
-    WarGameApp(root)
-    root.mainloop()
+    tracer = ChromeTracer(trace_path) if trace_path else None
+    try:
+        WarGameApp(root, tracer=tracer)
+        root.mainloop()
+    finally:
+        if tracer is not None:
+            tracer.close()
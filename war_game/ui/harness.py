@@ -0,0 +1,102 @@
+"""Plays a full animated game on a VirtualScheduler and reports UI step timings.
+
+Widgets still need a Tk display (use Xvfb in CI), but no real time passes:
+    python -m ui.harness --speed 4
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tkinter as tk
+from dataclasses import dataclass, field
+
+from model.tracing import ChromeTracer
+from ui.gui import WarGameApp
+from ui.scheduler import VirtualScheduler
+
+
+# A round takes a few hundred frames at most; more means the flow is stuck
+MAX_CALLBACKS_PER_ROUND = 100_000
+
+
+@dataclass
+class HarnessReport:
+    rounds: int
+    finished: bool
+    wall_seconds: float
+    virtual_seconds: float
+    step_timings: list[tuple[str, float]] = field(default_factory=list)
+
+    def per_action(self) -> dict[str, tuple[int, float]]:
+        """(count, mean seconds) of UI work per step action"""
+        totals: dict[str, list[float]] = {}
+        for action, seconds in self.step_timings:
+            totals.setdefault(action, []).append(seconds)
+        return {action: (len(times), sum(times) / len(times)) for action, times in totals.items()}
+
+
+def run_animated_game(
+    root: tk.Tk,
+    speed: float = 1.0,
+    max_rounds: int = 2000,
+    tracer: ChromeTracer | None = None,
+) -> HarnessReport:
+    scheduler = VirtualScheduler()
+    app = WarGameApp(root, scheduler=scheduler, speed=speed, tracer=tracer)
+    app.step_timings = []
+
+    rounds = 0
+    start = time.perf_counter()
+    while rounds < max_rounds and app.engine.state != "game_over":
+        app.on_play()
+        if scheduler.run(max_callbacks=MAX_CALLBACKS_PER_ROUND) == MAX_CALLBACKS_PER_ROUND:
+            raise RuntimeError(f"Round {rounds + 1} did not settle on the virtual scheduler")
+        rounds += 1
+    wall = time.perf_counter() - start
+
+    return HarnessReport(
+        rounds=rounds,
+        finished=app.engine.state == "game_over",
+        wall_seconds=wall,
+        virtual_seconds=scheduler.now(),
+        step_timings=app.step_timings,
+    )
+
+
+def positive_float(text: str) -> float:
+    value = float(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be positive, got {text}")
+    return value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--speed", type=positive_float, default=1.0)
+    parser.add_argument("--max-rounds", type=int, default=2000)
+    parser.add_argument("--trace", metavar="PATH", help="also write a Chrome trace to PATH")
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    root.withdraw()
+    tracer = ChromeTracer(args.trace) if args.trace else None
+    try:
+        report = run_animated_game(
+            root, speed=args.speed, max_rounds=args.max_rounds, tracer=tracer
+        )
+    finally:
+        if tracer is not None:
+            tracer.close()
+        root.destroy()
+
+    status = "finished" if report.finished else "cut off"
+    print(
+        f"{report.rounds} rounds ({status}) in {report.wall_seconds * 1000:.1f} ms wall, "
+        f"{report.virtual_seconds:.1f} s virtual"
+    )
+    for action, (count, mean) in sorted(report.per_action().items()):
+        print(f"  {action:<10} x{count:<6} {mean * 1e6:8.1f} us/step")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+import tkinter as tk
+from typing import Callable, Optional, Protocol
+
+
+class Scheduler(Protocol):
+    def now(self) -> float: ...
+
+    def after(self, delay_ms: int, callback: Callable[[], None]) -> object: ...
+
+    def cancel(self, handle: object) -> None: ...
+
+
+class TkScheduler:
+    """Runs callbacks on the Tk event loop in real time."""
+
+    def __init__(self, root: tk.Misc) -> None:
+        self.root = root
+
+    def now(self) -> float:
+        """current time in seconds"""
+        return time.perf_counter()
+
+    def after(self, delay_ms: int, callback: Callable[[], None]) -> object:
+        return self.root.after(delay_ms, callback)
+
+    def cancel(self, handle: object) -> None:
+        self.root.after_cancel(handle)
+
+
+class VirtualScheduler:
+    """Keeps its own clock and jumps straight to the next due callback.
+
+    Nothing runs until run() is called, so a whole animated game can be
+    played without waiting on real delays.
+    """
+
+    def __init__(self) -> None:
+        # Whole milliseconds, so due times never drift from float rounding
+        self.time_ms = 0
+        self._queue: list[tuple[int, int, Callable[[], None]]] = []
+        self._seq = itertools.count()
+        self._cancelled: set[int] = set()
+
+    def now(self) -> float:
+        """current virtual time in seconds"""
+        return self.time_ms / 1000
+
+    def after(self, delay_ms: int, callback: Callable[[], None]) -> object:
+        handle = next(self._seq)
+        heapq.heappush(self._queue, (self.time_ms + max(0, int(delay_ms)), handle, callback))
+        return handle
+
+    def cancel(self, handle: object) -> None:
+        self._cancelled.add(handle)
+
+    def run(self, max_callbacks: Optional[int] = None) -> int:
+        """runs due callbacks in order until the queue is empty, returns how many ran"""
+        ran = 0
+        while self._queue:
+            if max_callbacks is not None and ran >= max_callbacks:
+                break
+            due, handle, callback = heapq.heappop(self._queue)
+            if handle in self._cancelled:
+                self._cancelled.discard(handle)
+                continue
+            self.time_ms = max(self.time_ms, due)
+            callback()
+            ran += 1
+        return ran